@@ -114,4 +114,10 @@ async def main():
         print(f"\n❌ An error occurred during processing: {e}")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
+    # Use the libuv-based event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
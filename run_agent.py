@@ -123,6 +123,11 @@ parser.add_argument("--full-report", action="store_true",
 async def run_coordinator_agent(args):
     """Run the coordinator agent."""
     print("\n🚀 Running Coordinator Agent...")
+
+    # Let sub-agent tasks start running immediately instead of waiting for the next loop
+    # iteration (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
     
     # Initialize the agent
     agent = CoordinatorAgent(
@@ -288,4 +293,10 @@ async def main():
         print(f"\n❌ An unexpected error occurred: {e}")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
+    # Use the libuv-based event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
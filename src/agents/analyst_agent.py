@@ -8,10 +8,16 @@ import re
 
 from src.agents.base_agent import BaseAgent
 from src.config import get_logger
+from src.utils import json_utils
 from agents import WebSearchTool
 
 logger = get_logger(__name__)
 
+# Section and list-item patterns for the plain-text fallback in AnalystAgent._process_output
+_TRENDS_SECTION_RE = re.compile(r"(?:Trends|TRENDS|Key Trends):(.*?)(?:\n\n|\n[A-Z]|$)", re.DOTALL | re.IGNORECASE)
+_IMPLICATIONS_SECTION_RE = re.compile(r"(?:Implications|IMPLICATIONS|Key Implications):(.*?)(?:\n\n|\n[A-Z]|$)", re.DOTALL | re.IGNORECASE)
+_LIST_ITEM_SPLIT_RE = re.compile(r"\n-|\n\d+\.")
+
 class AnalystInput(BaseModel):
     """Input for the analyst agent."""
     
@@ -90,7 +96,7 @@ Format your final output as a single JSON object with a single key 'analysis' co
         """Process the agent output into the proper format."""
         try:
             # Try to parse as JSON first
-            data = json.loads(output)
+            data = json_utils.loads(output)
             return AnalystOutput(
                 insights=data.get("insights", ""),
                 trends=data.get("trends", []),
@@ -103,17 +109,17 @@ Format your final output as a single JSON object with a single key 'analysis' co
             
             # Try to extract trends section
             trends = []
-            trends_match = re.search(r"(?:Trends|TRENDS|Key Trends):(.*?)(?:\n\n|\n[A-Z]|$)", output, re.DOTALL | re.IGNORECASE)
+            trends_match = _TRENDS_SECTION_RE.search(output)
             if trends_match:
                 trends_text = trends_match.group(1).strip()
-                trends = [t.strip() for t in re.split(r"\n-|\n\d+\.", trends_text) if t.strip()]
+                trends = [t.strip() for t in _LIST_ITEM_SPLIT_RE.split(trends_text) if t.strip()]
             
             # Try to extract implications section
             implications = []
-            implications_match = re.search(r"(?:Implications|IMPLICATIONS|Key Implications):(.*?)(?:\n\n|\n[A-Z]|$)", output, re.DOTALL | re.IGNORECASE)
+            implications_match = _IMPLICATIONS_SECTION_RE.search(output)
             if implications_match:
                 implications_text = implications_match.group(1).strip()
-                implications = [i.strip() for i in re.split(r"\n-|\n\d+\.", implications_text) if i.strip()]
+                implications = [i.strip() for i in _LIST_ITEM_SPLIT_RE.split(implications_text) if i.strip()]
             
             # If no specific sections found, use the whole output as insights
             if not insights:
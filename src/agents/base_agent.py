@@ -93,7 +93,7 @@ class BaseAgent(Generic[InputT, OutputT], ABC):
         tracer_context = tracing.span if parent_trace else tracing.trace
         context_kwargs = {
             "name": f"{self.name}_execution", 
-            "metadata": {"input": input_data.model_dump()}
+            "metadata": {"input": input_data.model_dump()} if tracing.enabled else None
         }
         if not parent_trace: # Only pass parent_trace to trace, not span
              # We actually don't need to pass parent_trace to trace if creating a new one.
@@ -168,7 +168,7 @@ class BaseAgent(Generic[InputT, OutputT], ABC):
         tracer_context = tracing.span if parent_trace else tracing.trace
         context_kwargs = {
             "name": f"{self.name}_execution", 
-            "metadata": {"input": input_data.model_dump()}
+            "metadata": {"input": input_data.model_dump()} if tracing.enabled else None
         }
         # If not parent_trace, we are using tracing.trace, which doesn't need parent_trace param.
         # If parent_trace, we are using tracing.span, which doesn't accept parent_trace param.
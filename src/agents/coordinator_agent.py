@@ -1,28 +1,79 @@
 """Coordinator agent that orchestrates the multi-agent news workflow."""
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Awaitable, Iterable, Tuple, TYPE_CHECKING
 from pydantic import BaseModel, Field
-import logging
+from dataclasses import dataclass
 import asyncio
-import re
-import json
+import operator
+import os
+import httpx
+from openai import AsyncOpenAI
 
-from agents import function_tool
+from agents import set_default_openai_client
 from src.agents.base_agent import BaseAgent
-from src.agents.news_agent import NewsAgent, NewsRequest, NewsSummary
-from src.agents.writer_agent import WriterAgent, WriterInput, WriterOutput
-from src.agents.analyst_agent import AnalystAgent, AnalystInput, AnalystOutput
-from src.agents.fact_checker_agent import FactCheckerAgent, FactCheckerInput, FactCheckerOutput
-from src.agents.trend_agent import TrendAgent, TrendInput, TrendOutput
-from src.agents.finance_agent import FinanceAgent, FinanceInput, FinanceOutput, FinanceErrorOutput
+# The planner module stays eager because CoordinatorOutput needs ProcessingPlan at class creation
 from src.agents.planner_agent import PlannerAgent, PlannerInput, PlannerOutput, ProcessingPlan
 from src.config import get_logger
 from src.utils.tts import text_to_speech
 from src.utils.tracing import tracing
 from agents.tracing.traces import Trace
 
+if TYPE_CHECKING:
+    # News, writer and analyst modules are imported where they are used, so importing this
+    # module for its input/output schemas does not load them
+    from src.agents.news_agent import NewsSummary
+    from src.agents.writer_agent import WriterOutput
+    from src.agents.analyst_agent import AnalystOutput
+
 logger = get_logger(__name__)
 
+# Pooled OpenAI client registered as the Agents SDK default. The SDK default is process-wide state
+# used by every agent (including cached sub-agents and runs still finishing in the background), so
+# it is created once, on the first coordinator run, and never closed per coordinator.
+_shared_openai_client: Optional[AsyncOpenAI] = None
+
+def _install_shared_openai_client() -> None:
+    """Register the pooled OpenAI client with the Agents SDK, once per process."""
+    global _shared_openai_client
+    if _shared_openai_client is not None:
+        return
+    if not os.getenv("OPENAI_API_KEY"):
+        # Keep the SDK's own default, which reports the missing key when a model is called
+        return
+    # One keep-alive pool for every sub-agent's OpenAI calls, so TCP/TLS connections to the
+    # API are reused across agents instead of re-established per agent
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        timeout=httpx.Timeout(120.0, connect=10.0)
+    )
+    _shared_openai_client = AsyncOpenAI(http_client=http_client)
+    set_default_openai_client(_shared_openai_client)
+
+# Output field that carries each parallel analysis agent's context text
+_CONTEXT_FIELDS = {
+    "AnalystAgent": "insights",
+    "FactCheckerAgent": "summary",
+    "TrendAgent": "summary",
+}
+
+# Upper bound in seconds on each sub-agent run so one stalled agent cannot hold up the workflow
+AGENT_TIMEOUTS = {
+    "PlannerAgent": 60,
+    "NewsAgent": 120,
+    "FinanceAgent": 30,
+    "WriterAgent": 90,
+    "AnalystAgent": 120,
+    "FactCheckerAgent": 120,
+    "TrendAgent": 120,
+}
+
+# Article fields handed to the downstream agents, fetched together by one C-level getter
+_ARTICLE_FIELDS = ("title", "description", "source", "url", "published_at")
+_ARTICLE_GETTER = operator.attrgetter(*_ARTICLE_FIELDS)
+
+# Maps spaces to underscores and drops characters that are not allowed in the generated audio filename
+_FILENAME_TRANSLATION = str.maketrans(" ", "_", '\\/*?:"<>|')
+
 class CoordinatorInput(BaseModel):
     """Input for the coordinator agent."""
     
@@ -87,23 +138,28 @@ class CoordinatorInput(BaseModel):
         default=False
     )
 
-class AgentResult(BaseModel):
-    """Result from a single agent."""
+@dataclass(slots=True)
+class AgentResult:
+    """Result from a single agent.
+
+    A plain dataclass rather than a pydantic model: it is internal bookkeeping
+    around an already-validated agent output, so it needs no validation.
+    """
     
-    agent_name: str = Field(description="Name of the agent")
-    success: bool = Field(description="Whether the agent completed successfully")
-    data: Any = Field(description="Output data from the agent", default=None)
-    error: Optional[str] = Field(description="Error message if the agent failed", default=None)
+    agent_name: str  # Name of the agent
+    success: bool  # Whether the agent completed successfully
+    data: Any = None  # Output data from the agent
+    error: Optional[str] = None  # Error message if the agent failed
 
 class CoordinatorOutput(BaseModel):
     """Output from the coordinator agent."""
     
-    news_summary: Optional[str] = Field(description="Summary of the news")
-    audio_file: Optional[str] = Field(description="Path to the generated audio file")
-    markdown: Optional[str] = Field(description="Full markdown output")
-    analysis: Optional[str] = Field(description="Analysis of the news")
-    fact_check: Optional[str] = Field(description="Fact check results")
-    trends: Optional[str] = Field(description="Identified trends")
+    news_summary: Optional[str] = Field(description="Summary of the news", default=None)
+    audio_file: Optional[str] = Field(description="Path to the generated audio file", default=None)
+    markdown: Optional[str] = Field(description="Full markdown output", default=None)
+    analysis: Optional[str] = Field(description="Analysis of the news", default=None)
+    fact_check: Optional[str] = Field(description="Fact check results", default=None)
+    trends: Optional[str] = Field(description="Identified trends", default=None)
     financial_data: Optional[Dict[str, Any]] = Field(description="Financial data for the requested ticker symbol", default=None)
     graph_files: Optional[List[str]] = Field(description="List of paths to generated graph files", default=None)
     agent_results: List[AgentResult] = Field(description="Results from individual agents", default_factory=list)
@@ -112,6 +168,9 @@ class CoordinatorOutput(BaseModel):
 class CoordinatorAgent:
     """Agent that coordinates the multi-agent news workflow."""
     
+    # Sub-agent instances keyed by (class, model, temperature, verbose), shared across coordinators
+    _agent_cache: Dict[tuple, BaseAgent] = {}
+
     def __init__(self,
                  verbose: bool = False,
                  model: str = None,
@@ -136,52 +195,62 @@ class CoordinatorAgent:
             "FinanceAgent": finance_model_override,
             "PlannerAgent": planner_model_override
         }
+        # Overrides are fixed after construction, so resolve each agent's model once
+        self._resolved_models: Dict[str, str] = {
+            name: override or model for name, override in self.model_overrides.items()
+        }
         logger.info(f"CoordinatorAgent initialized with default model: {self.model}")
         active_overrides = {k: v for k, v in self.model_overrides.items() if v}
         if active_overrides:
             logger.info(f"  Model overrides: {active_overrides}")
 
-        # Instantiate sub-agents
-        self.news_agent = NewsAgent(
-            verbose=self.verbose,
-            model=self._get_agent_model("NewsAgent"),
-            temperature=self.temperature
-        )
-        self.writer_agent = WriterAgent(
-            verbose=self.verbose,
-            model=self._get_agent_model("WriterAgent"),
-            temperature=self.temperature
-        )
-        self.analyst_agent = AnalystAgent(
-            verbose=self.verbose,
-            model=self._get_agent_model("AnalystAgent"),
-            temperature=self.temperature
-        )
-        self.fact_checker_agent = FactCheckerAgent(
-            verbose=self.verbose,
-            model=self._get_agent_model("FactCheckerAgent"),
-            temperature=self.temperature
-        )
-        self.trend_agent = TrendAgent(
-            verbose=self.verbose,
-            model=self._get_agent_model("TrendAgent"),
-            temperature=self.temperature
-        )
-        self.finance_agent = FinanceAgent(
-            verbose=self.verbose,
-            model=self._get_agent_model("FinanceAgent"),
-            temperature=self.temperature
-        )
-        self.planner_agent = PlannerAgent(
-            verbose=self.verbose,
-            model=self._get_agent_model("PlannerAgent"),
-            temperature=self.temperature
-        )
+        # Instantiate sub-agents (reused across coordinators with the same configuration)
+        from src.agents.news_agent import NewsAgent
+        from src.agents.writer_agent import WriterAgent
+        from src.agents.analyst_agent import AnalystAgent
+        self.news_agent = self._get_or_create(NewsAgent, "NewsAgent")
+        self.writer_agent = self._get_or_create(WriterAgent, "WriterAgent")
+        self.analyst_agent = self._get_or_create(AnalystAgent, "AnalystAgent")
+        self.planner_agent = self._get_or_create(PlannerAgent, "PlannerAgent")
+        # FactChecker, Trend and Finance agents are optional per run; they are imported
+        # and created on first use in their _run_*_agent methods
         logger.info("Sub-agents initialized.")
 
     def _get_agent_model(self, agent_name: str) -> str:
         """Get the appropriate model for a given agent, considering overrides."""
-        return self.model_overrides.get(agent_name) or self.model
+        return self._resolved_models.get(agent_name, self.model)
+
+    def _get_or_create(self, agent_cls: type, agent_name: str) -> BaseAgent:
+        """Get a cached sub-agent for the current configuration, creating it on first use."""
+        model = self._get_agent_model(agent_name)
+        key = (agent_cls, model, self.temperature, self.verbose)
+        agent = self._agent_cache.get(key)
+        if agent is None:
+            agent = agent_cls(verbose=self.verbose, model=model, temperature=self.temperature)
+            self._agent_cache[key] = agent
+        return agent
+
+    def _collect_context(self, labelled_results: Iterable[Tuple[str, AgentResult]], context_texts: Dict[str, Optional[str]]) -> None:
+        """Record the context text of successful analysis agents, given (agent name, result) pairs in task order."""
+        for agent_name, result in labelled_results:
+            if result.success:
+                context_texts[agent_name] = getattr(result.data, _CONTEXT_FIELDS[agent_name], None)
+                logger.info(f"{agent_name} completed in parallel run.")
+            else:
+                logger.warning(f"{agent_name} failed in parallel run: {result.error}")
+
+    async def _with_timeout(self, agent_name: str, awaitable: Awaitable[Any]) -> Any:
+        """Await an agent call within the agent's AGENT_TIMEOUTS limit, raising TimeoutError when it runs out."""
+        timeout = AGENT_TIMEOUTS[agent_name]
+        try:
+            return await asyncio.wait_for(awaitable, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise asyncio.TimeoutError(f"Timed out after {timeout}s") from None
+
+    def _failed_result(self, agent_name: str, error: Exception) -> AgentResult:
+        """Log an agent failure (including a timeout) and wrap it in a failed AgentResult."""
+        logger.error(f"Error running {agent_name}: {str(error)}")
+        return AgentResult(agent_name=agent_name, success=False, error=str(error))
 
     async def _run_planner_agent(self, input_data: CoordinatorInput, parent_trace: Optional[Trace] = None) -> AgentResult:
         """Runs the PlannerAgent."""
@@ -193,7 +262,7 @@ class CoordinatorAgent:
                 count=input_data.count,
                 voice=input_data.voice
             )
-            planner_result: PlannerOutput = await self.planner_agent.run(planner_input, parent_trace=parent_trace)
+            planner_result: PlannerOutput = await self._with_timeout(agent_name, self.planner_agent.run(planner_input, parent_trace=parent_trace))
             
             if planner_result.success:
                 logger.info("PlannerAgent finished successfully.")
@@ -202,14 +271,14 @@ class CoordinatorAgent:
                 logger.error(f"PlannerAgent returned failure: {planner_result.error}")
                 return AgentResult(agent_name=agent_name, success=False, error=planner_result.error)
         except Exception as e:
-            logger.error(f"Error running PlannerAgent: {str(e)}")
-            return AgentResult(agent_name=agent_name, success=False, error=str(e))
+            return self._failed_result(agent_name, e)
 
     async def _run_news_agent(self, input_data: CoordinatorInput, parent_trace: Optional[Trace] = None) -> AgentResult:
         """Runs the NewsAgent."""
         logger.info(f"Starting NewsAgent for category: {input_data.category}")
         agent_name = "NewsAgent"
         try:
+            from src.agents.news_agent import NewsRequest
             news_input = NewsRequest(
                 category=input_data.category,
                 count=input_data.count,
@@ -217,24 +286,28 @@ class CoordinatorAgent:
                 sources=input_data.sources,
                 query=input_data.query,
                 voice=input_data.voice,
+                summary_style=input_data.summary_style,
                 # Disable audio generation here - we'll handle it at the end
                 generate_audio=False
             )
             # Run NewsAgent with parent trace context
-            news_result: NewsSummary = await self.news_agent.run(news_input, parent_trace=parent_trace)
+            news_result: NewsSummary = await self._with_timeout(agent_name, self.news_agent.run(news_input, parent_trace=parent_trace))
             logger.info(f"NewsAgent finished successfully for category: {news_result.category if news_result else 'N/A'}")
             return AgentResult(agent_name=agent_name, success=True, data=news_result)
         except Exception as e:
-            logger.error(f"Error running NewsAgent: {str(e)}")
-            return AgentResult(agent_name=agent_name, success=False, error=str(e))
+            return self._failed_result(agent_name, e)
 
     async def _run_finance_agent(self, ticker_symbol: str, parent_trace: Optional[Trace] = None) -> AgentResult:
         """Runs the FinanceAgent."""
         logger.info(f"Starting FinanceAgent for ticker: {ticker_symbol}")
         agent_name = "FinanceAgent"
         try:
-            finance_input = FinanceInput(ticker_symbol=ticker_symbol)
-            finance_result = await self.finance_agent.run(finance_input, parent_trace=parent_trace)
+            from src.agents.finance_agent import FinanceAgent, FinanceInput, FinanceOutput, FinanceErrorOutput
+            finance_agent = self._get_or_create(FinanceAgent, agent_name)
+            finance_input = FinanceInput(symbol=ticker_symbol)
+            # FinanceAgent calls the blocking finance tool directly (no LLM), so run it
+            # in a worker thread to keep the event loop free for the other agents
+            finance_result = await self._with_timeout(agent_name, asyncio.to_thread(finance_agent.run_sync, finance_input, parent_trace=parent_trace))
 
             if isinstance(finance_result, FinanceErrorOutput):
                 logger.error(f"FinanceAgent returned an error: {finance_result.error}")
@@ -248,35 +321,35 @@ class CoordinatorAgent:
                  return AgentResult(agent_name=agent_name, success=False, error="Unexpected result type from FinanceAgent")
 
         except Exception as e:
-            logger.error(f"Error running FinanceAgent: {str(e)}")
-            return AgentResult(agent_name=agent_name, success=False, error=str(e))
+            return self._failed_result(agent_name, e)
 
-    async def _run_writer_agent(self, category: str, articles: List[Dict], style: str, analysis: Optional[str] = None, trends: Optional[str] = None, financial_data: Optional[Dict] = None, parent_trace: Optional[Trace] = None) -> AgentResult:
+    async def _run_writer_agent(self, category: str, articles: List[Dict], style: str, context: Optional[str] = None, parent_trace: Optional[Trace] = None) -> AgentResult:
         """Runs the WriterAgent."""
         logger.info(f"Starting WriterAgent for category: {category} with style: {style}")
         agent_name = "WriterAgent"
         try:
-            writer_input = WriterInput(
+            from src.agents.writer_agent import WriterInput
+            # The articles come from validated NewsArticle models and the rest from the validated
+            # CoordinatorInput, so skip re-validating every article dict
+            writer_input = WriterInput.model_construct(
                 category=category,
                 articles=articles,
-                summary_style=style,
-                analysis=analysis,
-                trends=trends,
-                financial_data=financial_data
+                summary_style=style or "conversational",
+                context=context
             )
-            writer_result: WriterOutput = await self.writer_agent.run(writer_input, parent_trace=parent_trace)
+            writer_result: WriterOutput = await self._with_timeout(agent_name, self.writer_agent.run(writer_input, parent_trace=parent_trace))
             logger.info(f"WriterAgent finished successfully.")
             # Assuming WriterOutput has 'summary' and 'markdown' fields
             return AgentResult(agent_name=agent_name, success=True, data=writer_result)
         except Exception as e:
-            logger.error(f"Error running WriterAgent: {str(e)}")
-            return AgentResult(agent_name=agent_name, success=False, error=str(e))
+            return self._failed_result(agent_name, e)
 
     async def _run_analyst_agent(self, category: str, articles: List[Dict], summary: str, depth: str, financial_data: Optional[Dict] = None, parent_trace: Optional[Trace] = None) -> AgentResult:
         """Runs the AnalystAgent."""
         logger.info(f"Starting AnalystAgent for category: {category} with depth: {depth}")
         agent_name = "AnalystAgent"
         try:
+            from src.agents.analyst_agent import AnalystInput
             analyst_input = AnalystInput(
                 category=category,
                 articles=articles,
@@ -284,48 +357,77 @@ class CoordinatorAgent:
                 analysis_depth=depth,
                 financial_data=financial_data
             )
-            analyst_result: AnalystOutput = await self.analyst_agent.run(analyst_input, parent_trace=parent_trace)
+            analyst_result: AnalystOutput = await self._with_timeout(agent_name, self.analyst_agent.run(analyst_input, parent_trace=parent_trace))
             logger.info(f"AnalystAgent finished successfully.")
             # Assuming AnalystOutput has 'analysis' field
             return AgentResult(agent_name=agent_name, success=True, data=analyst_result)
         except Exception as e:
-            logger.error(f"Error running AnalystAgent: {str(e)}")
-            return AgentResult(agent_name=agent_name, success=False, error=str(e))
+            return self._failed_result(agent_name, e)
 
     async def _run_fact_checker_agent(self, articles: List[Dict], summary: str, max_claims: int, parent_trace: Optional[Trace] = None) -> AgentResult:
         """Runs the FactCheckerAgent."""
         logger.info(f"Starting FactCheckerAgent (max claims: {max_claims})")
         agent_name = "FactCheckerAgent"
         try:
+            from src.agents.fact_checker_agent import FactCheckerAgent, FactCheckerInput, FactCheckerOutput
+            fact_checker_agent = self._get_or_create(FactCheckerAgent, agent_name)
             fact_checker_input = FactCheckerInput(
                 articles=articles,
                 summary=summary,
                 max_claims=max_claims
             )
-            fact_checker_result: FactCheckerOutput = await self.fact_checker_agent.run(fact_checker_input, parent_trace=parent_trace)
+            fact_checker_result: FactCheckerOutput = await self._with_timeout(agent_name, fact_checker_agent.run(fact_checker_input, parent_trace=parent_trace))
             logger.info(f"FactCheckerAgent finished successfully.")
             # Assuming FactCheckerOutput has 'fact_check_results' field
             return AgentResult(agent_name=agent_name, success=True, data=fact_checker_result)
         except Exception as e:
-            logger.error(f"Error running FactCheckerAgent: {str(e)}")
-            return AgentResult(agent_name=agent_name, success=False, error=str(e))
+            return self._failed_result(agent_name, e)
 
     async def _run_trend_agent(self, category: str, articles: List[Dict], parent_trace: Optional[Trace] = None) -> AgentResult:
         """Runs the TrendAgent."""
         logger.info(f"Starting TrendAgent for category: {category}")
         agent_name = "TrendAgent"
         try:
+            from src.agents.trend_agent import TrendAgent, TrendInput, TrendOutput
+            trend_agent = self._get_or_create(TrendAgent, agent_name)
             trend_input = TrendInput(
                 category=category,
                 articles=articles
             )
-            trend_result: TrendOutput = await self.trend_agent.run(trend_input, parent_trace=parent_trace)
+            trend_result: TrendOutput = await self._with_timeout(agent_name, trend_agent.run(trend_input, parent_trace=parent_trace))
             logger.info(f"TrendAgent finished successfully.")
             # Assuming TrendOutput has 'identified_trends' field
             return AgentResult(agent_name=agent_name, success=True, data=trend_result)
         except Exception as e:
-            logger.error(f"Error running TrendAgent: {str(e)}")
-            return AgentResult(agent_name=agent_name, success=False, error=str(e))
+            return self._failed_result(agent_name, e)
+
+    async def _generate_audio(self, text: str, input_data: CoordinatorInput, parent_trace: Optional[Trace] = None) -> Optional[str]:
+        """Converts the final summary to speech, returning the audio file path or None on failure."""
+        logger.info(f"Generating audio with voice: {input_data.voice}")
+        try:
+            # Use a nested span for TTS
+            with tracing.span("generate_audio") as audio_span:
+                # Ensure the filename is valid (underscores for spaces, special chars removed) in one pass
+                output_filename = f"news_summary_{input_data.category}_{input_data.ticker_symbol or 'general'}.mp3".translate(_FILENAME_TRANSLATION)
+
+                # The OpenAI TTS call blocks, so keep it off the event loop
+                audio_file_path = await asyncio.to_thread(
+                    text_to_speech, text, input_data.voice, filename=output_filename
+                )
+                if audio_file_path:
+                    logger.info(f"Audio file generated: {audio_file_path}")
+                    if audio_span:
+                        audio_span.set_data({"status": "success", "file_path": audio_file_path})
+                else:
+                    logger.error("Failed to generate audio file.")
+                    if audio_span:
+                        audio_span.set_data({"status": "failed"})
+                return audio_file_path
+        except Exception as e:
+            logger.error(f"Error generating audio: {str(e)}")
+            if parent_trace: # Record error at coordinator level if TTS span fails
+                parent_trace.set_error({"message": f"Audio generation failed: {str(e)}"})
+            return None
 
     async def run(self, input_data: CoordinatorInput) -> CoordinatorOutput:
         """
@@ -337,8 +439,13 @@ class CoordinatorAgent:
         Returns:
             A comprehensive output with results from all agents
         """
+        _install_shared_openai_client()
+
         # Start the top-level trace for the coordinator
-        with tracing.trace("CoordinatorAgent_run", {"input": input_data.model_dump()}) as coordinator_trace:
+        # Only serialize the input for trace metadata when tracing is on, and leave out
+        # fields still at their defaults
+        trace_metadata = {"input": input_data.model_dump(exclude_defaults=True)} if tracing.enabled else None
+        with tracing.trace("CoordinatorAgent_run", trace_metadata) as coordinator_trace:
             agent_results: List[AgentResult] = []
             articles_data = []
             news_summary_text = None
@@ -389,6 +496,13 @@ class CoordinatorAgent:
             if execute_default_workflow:
                 logger.info("Executing default workflow.")
 
+            # Start fetching financial data (optional) now so it overlaps with the news fetch
+            finance_task: Optional[asyncio.Task] = None
+            if input_data.ticker_symbol:
+                finance_task = asyncio.create_task(
+                    self._run_finance_agent(input_data.ticker_symbol, parent_trace=coordinator_trace)
+                )
+
             # Step 1: Fetch news
             news_agent_result = await self._run_news_agent(input_data, parent_trace=coordinator_trace)
             agent_results.append(news_agent_result)
@@ -398,13 +512,7 @@ class CoordinatorAgent:
                 # Directly extract article data if NewsSummary object is valid
                 if news_summary_obj and hasattr(news_summary_obj, 'articles'):
                     articles_data = [
-                        {
-                            "title": article.title,
-                            "description": article.description,
-                            "source": article.source,
-                            "url": article.url,
-                            "published_at": article.published_at
-                        }
+                        dict(zip(_ARTICLE_FIELDS, _ARTICLE_GETTER(article)))
                         for article in news_summary_obj.articles
                     ]
                     logger.info(f"Extracted {len(articles_data)} articles from NewsAgent result.")
@@ -419,20 +527,19 @@ class CoordinatorAgent:
                          # For now, just log it. Coordinator will proceed without articles.
             else:
                 logger.error("NewsAgent failed. Unable to proceed with main workflow.")
+                if finance_task:
+                    finance_task.cancel()
                 # Return early with failure indication
-                return CoordinatorOutput(agent_results=agent_results)
+                return CoordinatorOutput.model_construct(agent_results=agent_results)
 
-            # Step 2: Fetch financial data (optional)
-            if input_data.ticker_symbol:
-                finance_agent_result = await self._run_finance_agent(input_data.ticker_symbol, parent_trace=coordinator_trace)
+            # Step 2: Collect financial data (optional), which ran alongside the news fetch
+            if finance_task:
+                finance_agent_result = await finance_task
                 agent_results.append(finance_agent_result)
                 if finance_agent_result.success:
                     financial_data_dict = finance_agent_result.data # This should be a dict now
-                    # Extract graph file paths if they exist in the FinanceOutput data
-                    graph_files_list = financial_data_dict.get("graph_files", [])
-                    # Remove graph_files from the main financial_data dict if needed
-                    if "graph_files" in financial_data_dict:
-                        del financial_data_dict["graph_files"]
+                    # Take graph file paths (if any) out of the financial data in one step
+                    graph_files_list = financial_data_dict.pop("graph_files", [])
                 else:
                      logger.warning(f"FinanceAgent failed for {input_data.ticker_symbol}: {finance_agent_result.error}")
                      # Continue without financial data
@@ -440,35 +547,35 @@ class CoordinatorAgent:
             # Ensure we have some articles before proceeding
             if not articles_data:
                 logger.error("No articles available to process. Skipping further steps.")
-                return CoordinatorOutput(agent_results=agent_results)
-
+                return CoordinatorOutput.model_construct(agent_results=agent_results)
 
-            # Step 3: Run Writer Agent (initial summary based on news)
-            # We run the writer first to get a basic summary, which might be needed by other agents
-            writer_result_initial = await self._run_writer_agent(
-                category=input_data.category,
-                articles=articles_data,
-                style=input_data.summary_style,
-                # Pass financial data if available, even for the initial run
-                financial_data=financial_data_dict,
-                parent_trace=coordinator_trace
-            )
-            agent_results.append(writer_result_initial)
 
-            if writer_result_initial.success:
-                writer_output_initial: WriterOutput = writer_result_initial.data
-                news_summary_text = writer_output_initial.summary # Get initial summary
-                full_markdown = writer_output_initial.markdown # Get initial markdown
-                logger.info("Initial summary generated by WriterAgent.")
-            else:
-                logger.error("Initial WriterAgent run failed. Summary will be missing.")
-                # Continue, but summary-dependent steps might fail
+            # Step 3: Use NewsAgent's own summary as the initial summary. NewsAgent already writes a
+            # concise summary and markdown, so a separate initial WriterAgent pass would only add a
+            # serial LLM round trip; the writer runs once, to fold in analysis and trends (Step 5)
+            news_summary_text = news_summary_obj.summary
+            full_markdown = news_summary_obj.markdown
 
             # Step 4: Run parallel analyses (Analyst, Fact Checker, Trend)
-            parallel_tasks = []
+            # The writer refinement only consumes analysis and trends, so the fact checker runs
+            # separately from the gathered tasks and keeps going until the end of the workflow
+            parallel_tasks: Dict[str, asyncio.Task] = {}
+            fact_checker_task: Optional[asyncio.Task] = None
+            context_texts: Dict[str, Optional[str]] = {}
             if news_summary_text: # Only run these if we have a summary
+                 # Fact Checker Agent (optional)
+                 if input_data.use_fact_checker:
+                     fact_checker_task = asyncio.create_task(
+                         self._run_fact_checker_agent(
+                             articles=articles_data,
+                             summary=news_summary_text,
+                             max_claims=input_data.max_fact_claims,
+                             parent_trace=coordinator_trace
+                         )
+                     )
+
                  # Analyst Agent
-                 parallel_tasks.append(
+                 parallel_tasks["AnalystAgent"] = asyncio.create_task(
                      self._run_analyst_agent(
                          category=input_data.category,
                          articles=articles_data,
@@ -479,106 +586,82 @@ class CoordinatorAgent:
                      )
                  )
 
-                 # Fact Checker Agent (optional)
-                 if input_data.use_fact_checker:
-                     parallel_tasks.append(
-                         self._run_fact_checker_agent(
-                             articles=articles_data,
-                             summary=news_summary_text,
-                             max_claims=input_data.max_fact_claims,
-                             parent_trace=coordinator_trace
-                         )
-                     )
-
                  # Trend Analyzer Agent (optional)
                  if input_data.use_trend_analyzer:
-                     parallel_tasks.append(
+                     parallel_tasks["TrendAgent"] = asyncio.create_task(
                          self._run_trend_agent(
                              category=input_data.category,
                              articles=articles_data,
                              parent_trace=coordinator_trace
                          )
                      )
+
+                 # The _run_*_agent methods catch their own errors, so gather only has to collect results
+                 parallel_results: List[AgentResult] = await asyncio.gather(*parallel_tasks.values())
+                 agent_results.extend(parallel_results) # Add results to the main list
+                 # Task results line up with the dict's insertion order, so label them positionally
+                 self._collect_context(zip(parallel_tasks, parallel_results), context_texts)
+                 analysis_text = context_texts.get("AnalystAgent")
+                 trends_text = context_texts.get("TrendAgent")
             else:
                  logger.warning("Skipping parallel analysis agents as initial summary is missing.")
 
 
-            # Execute parallel tasks if any were added
-            parallel_results: List[AgentResult] = []
-            if parallel_tasks:
-                parallel_results = await asyncio.gather(*parallel_tasks)
-                agent_results.extend(parallel_results) # Add results to the main list
-
-                # Process parallel results
-                for result in parallel_results:
-                    if result.success:
-                        if result.agent_name == "AnalystAgent":
-                            analyst_output: AnalystOutput = result.data
-                            analysis_text = analyst_output.analysis
-                            logger.info("AnalystAgent completed in parallel run.")
-                        elif result.agent_name == "FactCheckerAgent":
-                            fact_checker_output: FactCheckerOutput = result.data
-                            fact_check_text = fact_checker_output.fact_check_results # Assuming this field name
-                            logger.info("FactCheckerAgent completed in parallel run.")
-                        elif result.agent_name == "TrendAgent":
-                            trend_output: TrendOutput = result.data
-                            trends_text = trend_output.identified_trends # Assuming this field name
-                            logger.info("TrendAgent completed in parallel run.")
-                    else:
-                        logger.warning(f"{result.agent_name} failed in parallel run: {result.error}")
-
-
-            # Step 5: (Optional) Run Writer Agent again to refine summary/markdown with analysis/trends
-            # Decide if a second writer pass is needed based on whether new info was generated
+            # Step 5: (Optional) Run Writer Agent to refine summary/markdown with analysis/trends
+            # Decide if a writer pass is needed based on whether new info was generated
             if analysis_text or trends_text:
-                 logger.info("Running WriterAgent again to incorporate analysis and trends.")
+                 logger.info("Running WriterAgent to incorporate analysis and trends.")
+                 # Join only the sections that have content, so the writer prompt carries no empty labels
+                 context_parts = [f"Original News Summary:\n{news_summary_text}"]
+                 if analysis_text:
+                     context_parts.append(f"Analysis:\n{analysis_text}")
+                 if trends_text:
+                     context_parts.append(f"Trend Summary:\n{trends_text}")
+                 if financial_data_dict:
+                     context_parts.append(f"Financial Data:\n{financial_data_dict}")
+                 combined_context = "\n\n".join(context_parts)
                  writer_result_final = await self._run_writer_agent(
                      category=input_data.category,
                      articles=articles_data,
                      style=input_data.summary_style,
-                     analysis=analysis_text,
-                     trends=trends_text,
-                     financial_data=financial_data_dict,
+                     context=combined_context,
                      parent_trace=coordinator_trace
                  )
-                 # Replace initial writer result, don't append duplicates
-                 agent_results = [res for res in agent_results if res.agent_name != "WriterAgent"] + [writer_result_final]
+                 agent_results.append(writer_result_final)
 
                  if writer_result_final.success:
                      writer_output_final: WriterOutput = writer_result_final.data
-                     news_summary_text = writer_output_final.summary # Update with final summary
-                     full_markdown = writer_output_final.markdown # Update with final markdown
+                     news_summary_text = writer_output_final.final_summary # Update with final summary
+                     # Update with final markdown; writers without a separate markdown version leave it unset
+                     full_markdown = writer_output_final.markdown_output or writer_output_final.final_summary
                      logger.info("Final summary and markdown generated by WriterAgent.")
                  else:
-                     logger.error("Final WriterAgent run failed. Using initial summary/markdown if available.")
-                     # Keep the potentially non-None values from the initial run
+                     logger.error("Final WriterAgent run failed. Using NewsAgent summary/markdown.")
+                     # Keep the values from NewsAgent
 
 
-            # Step 6: Generate Audio (Optional)
+            # Step 6: Generate Audio (Optional), in a worker thread so it overlaps with the
+            # fact checker that may still be running
+            audio_task: Optional[asyncio.Task] = None
             if input_data.generate_audio and news_summary_text:
-                logger.info(f"Generating audio with voice: {input_data.voice}")
-                try:
-                    # Use a nested span for TTS
-                    with tracing.span("generate_audio", parent=coordinator_trace) as audio_span:
-                        output_filename = f"news_summary_{input_data.category}_{input_data.ticker_symbol or 'general'}.mp3".replace(" ", "_")
-                        # Ensure the filename is valid (e.g., replace special chars)
-                        output_filename = re.sub(r'[\\/*?:"<>|]', "", output_filename)
-
-                        audio_file_path = text_to_speech(news_summary_text, input_data.voice, output_filename)
-                        if audio_file_path:
-                            logger.info(f"Audio file generated: {audio_file_path}")
-                            audio_span.set_data({"status": "success", "file_path": audio_file_path})
-                        else:
-                            logger.error("Failed to generate audio file.")
-                            audio_span.set_data({"status": "failed"})
-                except Exception as e:
-                    logger.error(f"Error generating audio: {str(e)}")
-                    if coordinator_trace: # Record error at coordinator level if TTS span fails
-                        coordinator_trace.set_error({"message": f"Audio generation failed: {str(e)}"})
+                audio_task = asyncio.create_task(
+                    self._generate_audio(news_summary_text, input_data, parent_trace=coordinator_trace)
+                )
+
+            # Collect the fact checker result that ran alongside the writer
+            if fact_checker_task:
+                fact_checker_result = await fact_checker_task
+                agent_results.append(fact_checker_result)
+                self._collect_context((("FactCheckerAgent", fact_checker_result),), context_texts)
+                fact_check_text = context_texts.get("FactCheckerAgent")
+
+            if audio_task:
+                audio_file_path = await audio_task
 
 
             # Step 7: Compile final output
-            final_output = CoordinatorOutput(
+            # Every field comes from already-validated agent outputs, so skip re-validation
+            final_output = CoordinatorOutput.model_construct(
                 news_summary=news_summary_text,
                 audio_file=audio_file_path,
                 markdown=full_markdown,
@@ -593,5 +676,6 @@ class CoordinatorAgent:
 
             # Log completion and add final output to trace
             logger.info("CoordinatorAgent workflow finished.")
-            coordinator_trace.set_data({"final_output_summary": final_output.model_dump(exclude={'agent_results'})}) # Log summary, exclude detailed results
+            if coordinator_trace:
+                coordinator_trace.set_data({"final_output_summary": final_output.model_dump(exclude={'agent_results'})}) # Log summary, exclude detailed results
             return final_output 
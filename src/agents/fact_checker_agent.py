@@ -3,14 +3,40 @@
 from typing import List, Dict, Optional, Any
 from pydantic import BaseModel, Field
 import logging
-import json
+import re
 
 from agents import function_tool, WebSearchTool
-from src.agents.base_agent import BaseAgent
+from src.agents.base_agent import BaseAgent, Trace
 from src.config import get_logger
+from src.utils import json_utils
+from src.utils.cache import TTLCache
 
 logger = get_logger(__name__)
 
+# How long (seconds) a fact-check result is reused for identical articles and summary
+FACT_CHECK_CACHE_TTL = 600
+
+# Fallback values for verification fields missing from the agent's JSON output
+_VERIFICATION_DEFAULTS = (
+    ("claim", ""),
+    ("assessment", "Unverified"),
+    ("explanation", ""),
+    ("confidence", "Low"),
+    ("sources", []),
+)
+
+# Field labels for the plain-text fallback in _process_output, matched together in a single scan.
+# The name of the group that matched (match.lastgroup) tells which field a label opens.
+_FIELD_LABEL_RE = re.compile(
+    r"(?:(?P<claim>Claim|CLAIM)\s*(?:\d+)?"
+    r"|(?P<assessment>Assessment|ASSESSMENT)"
+    r"|(?P<explanation>Explanation|EXPLANATION)"
+    r"|(?P<confidence>Confidence|CONFIDENCE)"
+    r"|(?P<sources>Sources|SOURCES)"
+    r"|(?P<summary>(?i:summary))):\s*"
+)
+_SOURCES_SPLIT_RE = re.compile(r",|\n-")
+
 class Claim(BaseModel):
     """Model for a fact claim."""
     
@@ -70,6 +96,8 @@ class FactCheckerAgent(BaseAgent[FactCheckerInput, FactCheckerOutput]):
 
     def __init__(self, verbose: bool = False, model: str = None, temperature: float = None):
         """Initialize the fact checker agent."""
+        # Recent results keyed by the articles, summary and claim limit they were checked for
+        self._cache = TTLCache(maxsize=128, ttl=FACT_CHECK_CACHE_TTL)
         
         super().__init__(
             name="FactCheckerAgent",
@@ -85,76 +113,83 @@ class FactCheckerAgent(BaseAgent[FactCheckerInput, FactCheckerOutput]):
         
         logger.info("FactCheckerAgent initialized")
     
+    async def run(self, input_data: FactCheckerInput, parent_trace: Optional[Trace] = None) -> FactCheckerOutput:
+        """
+        Run the fact checker, reusing a recent result for identical input.
+        
+        Args:
+            input_data: The articles and summary to check
+            parent_trace: The parent trace for the agent's output
+            
+        Returns:
+            The fact-checking results
+        """
+        cache_key = self._cache_key(input_data)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached fact-check result")
+            return cached.model_copy(deep=True)
+        
+        result = await super().run(input_data, parent_trace=parent_trace)
+        
+        # Results without verifications usually mean the output could not be parsed, so they are not cached
+        if result.verifications:
+            self._cache.set(cache_key, result.model_copy(deep=True))
+        return result
+    
+    @staticmethod
+    def _cache_key(input_data: FactCheckerInput) -> tuple:
+        """Build the result cache key from the summary, claim limit and article identities."""
+        return (
+            input_data.summary,
+            input_data.max_claims,
+            tuple((article.get("title"), article.get("url")) for article in input_data.articles)
+        )
+    
     def _process_output(self, output: str) -> FactCheckerOutput:
         """Process the agent output into the proper format."""
-        import re
-        
         try:
             # Try to parse as JSON first
-            data = json.loads(output)
-            verifications = []
-            for v in data.get("verifications", []):
-                verifications.append(VerificationResult(
-                    claim=v.get("claim", ""),
-                    assessment=v.get("assessment", "Unverified"),
-                    explanation=v.get("explanation", ""),
-                    confidence=v.get("confidence", "Low"),
-                    sources=v.get("sources", [])
-                ))
-            
-            return FactCheckerOutput(
-                verifications=verifications,
-                summary=data.get("summary", "")
-            )
+            data = json_utils.loads(output)
+            # Validate the whole output in one call; pydantic builds the nested verifications
+            return FactCheckerOutput.model_validate({
+                "verifications": [
+                    {key: v.get(key, default) for key, default in _VERIFICATION_DEFAULTS}
+                    for v in data.get("verifications", [])
+                ],
+                "summary": data.get("summary", "")
+            })
         except:
-            # If not JSON, try to extract information from text
+            # If not JSON, try to extract information from text. All field labels are found in one
+            # pass; each field's text runs up to the next label, and fields attach to the latest claim.
             verifications = []
+            summary = None
+            labels = list(_FIELD_LABEL_RE.finditer(output))
             
-            # Try to find claim sections
-            claim_pattern = r"(?:Claim|CLAIM)\s*(?:\d+)?:\s*(.*?)(?:\n|$)"
-            assessment_pattern = r"(?:Assessment|ASSESSMENT):\s*(.*?)(?:\n|$)"
-            explanation_pattern = r"(?:Explanation|EXPLANATION):\s*(.*?)(?:\n\n|\n(?:Claim|Confidence)|$)"
-            confidence_pattern = r"(?:Confidence|CONFIDENCE):\s*(.*?)(?:\n|$)"
-            sources_pattern = r"(?:Sources|SOURCES):\s*(.*?)(?:\n\n|\n(?:Claim)|$)"
-            
-            claims = re.finditer(claim_pattern, output, re.DOTALL)
-            
-            for claim_match in claims:
-                claim = claim_match.group(1).strip()
-                pos = claim_match.end()
+            for i, label in enumerate(labels):
+                field = label.lastgroup
+                end = labels[i + 1].start() if i + 1 < len(labels) else len(output)
+                text = output[label.end():end]
                 
-                # Find assessment
-                assessment_match = re.search(assessment_pattern, output[pos:pos+500])
-                assessment = assessment_match.group(1).strip() if assessment_match else "Unverified"
-                
-                # Find explanation
-                explanation_match = re.search(explanation_pattern, output[pos:pos+1000], re.DOTALL)
-                explanation = explanation_match.group(1).strip() if explanation_match else ""
-                
-                # Find confidence
-                confidence_match = re.search(confidence_pattern, output[pos:pos+500])
-                confidence = confidence_match.group(1).strip() if confidence_match else "Low"
-                
-                # Find sources
-                sources = []
-                sources_match = re.search(sources_pattern, output[pos:pos+500], re.DOTALL)
-                if sources_match:
-                    sources_text = sources_match.group(1).strip()
-                    sources = [s.strip() for s in re.split(r',|\n-', sources_text) if s.strip()]
-                
-                verifications.append(VerificationResult(
-                    claim=claim,
-                    assessment=assessment,
-                    explanation=explanation,
-                    confidence=confidence,
-                    sources=sources
-                ))
-            
-            # Extract summary
-            summary_match = re.search(r"(?:Summary|SUMMARY):(.*?)(?:$)", output, re.DOTALL | re.IGNORECASE)
-            summary = summary_match.group(1).strip() if summary_match else output
+                if field == "summary":
+                    # The summary runs to the end of the output, as before
+                    if summary is None:
+                        summary = output[label.end():].strip()
+                elif field == "claim":
+                    verifications.append({"claim": text.partition("\n")[0].strip()})
+                elif verifications and field not in verifications[-1]:
+                    if field in ("assessment", "confidence"):
+                        verifications[-1][field] = text.partition("\n")[0].strip()
+                    elif field == "explanation":
+                        verifications[-1][field] = text.partition("\n\n")[0].strip()
+                    else:
+                        sources_text = text.partition("\n\n")[0].strip()
+                        verifications[-1][field] = [s.strip() for s in _SOURCES_SPLIT_RE.split(sources_text) if s.strip()]
             
-            return FactCheckerOutput(
-                verifications=verifications,
-                summary=summary
-            ) 
+            return FactCheckerOutput.model_validate({
+                "verifications": [
+                    {key: v.get(key, default) for key, default in _VERIFICATION_DEFAULTS}
+                    for v in verifications
+                ],
+                "summary": summary if summary is not None else output
+            }) 
@@ -6,6 +6,7 @@ import logging
 from src.agents.base_agent import BaseAgent, InputT, OutputT # Use existing base
 from src.tools.finance_tool import get_stock_info, StockInfo # Import the tool and its model
 from src.config import get_logger
+from src.utils import json_utils
 from src.utils.tracing import tracing # Ensure tracing is imported
 from agents.tracing.traces import Trace # Import Trace for type hinting
 from agents.tracing.spans import Span # Import Span for type hinting
@@ -51,7 +52,7 @@ class FinanceAgent(BaseAgent[FinanceInput, FinanceOutput]):
         tracer_context = tracing.span if parent_trace else tracing.trace
         context_kwargs = {
             "name": f"{self.name}_execution", 
-            "metadata": {"input": input_data.model_dump()}
+            "metadata": {"input": input_data.model_dump()} if tracing.enabled else None
         }
 
         # Use span if nested, otherwise start a new trace
@@ -60,7 +61,7 @@ class FinanceAgent(BaseAgent[FinanceInput, FinanceOutput]):
                 # Call the finance tool directly - maybe wrap this in a processing span too?
                 with tracing.span(f"{self.name}_processing") as processing_span:
                     stock_json = get_stock_info(input_data.symbol)
-                    stock_data = json.loads(stock_json)
+                    stock_data = json_utils.loads(stock_json)
                     
                     # Record results in processing_span
                     if processing_span: 
@@ -1,7 +1,9 @@
 """Example agent demonstrating the updated BaseAgent implementation."""
 
 from typing import Dict, Any, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from contextvars import ContextVar
+import asyncio
 import json
 import os
 
@@ -10,9 +12,18 @@ from agents import function_tool, WebSearchTool
 from src.agents.base_agent import BaseAgent, Trace
 from src.tools.news_tool import fetch_news_tool, FetchNewsInput
 from src.config import get_logger
+from src.utils import json_utils
+from src.utils.cache import TTLCache
 
 logger = get_logger(__name__)
 
+# How long (seconds) a summary is reused for an identical news request
+NEWS_CACHE_TTL = 300
+
+# Category of the request currently being processed, read back in _process_output. A context
+# variable rather than an attribute so concurrent runs on one NewsAgent don't overwrite each other.
+_requested_category: ContextVar[str] = ContextVar("news_requested_category", default="unknown")
+
 class NewsRequest(BaseModel):
     """Input model for the news agent."""
     
@@ -56,6 +67,8 @@ class NewsRequest(BaseModel):
 class NewsArticle(BaseModel):
     """Model for a news article."""
     
+    model_config = ConfigDict(frozen=True)
+    
     title: str
     description: str
     url: str
@@ -65,6 +78,9 @@ class NewsArticle(BaseModel):
 class NewsSummary(BaseModel):
     """Model for a news summary."""
     
+    # Frozen so cached summaries can be handed to concurrent callers without copying
+    model_config = ConfigDict(frozen=True)
+    
     category: str = Field(description="Category requested")
     article_count: int = Field(description="Number of articles processed")
     articles: List[NewsArticle] = Field(description="List of processed articles")
@@ -73,7 +89,7 @@ class NewsSummary(BaseModel):
 
 # Create a function_tool from the existing fetch_news_tool
 @function_tool
-def fetch_news(
+async def fetch_news(
     category: str, 
     count: int, 
     country: str = None, 
@@ -107,15 +123,18 @@ def fetch_news(
         page=page
     )
     
-    return fetch_news_tool.run(input_data)
+    # The News API request is blocking, so run it in a worker thread to keep the event loop free
+    return await asyncio.to_thread(fetch_news_tool.run, input_data)
 
 class NewsAgent(BaseAgent[NewsRequest, NewsSummary]):
     """Agent that fetches and summarizes news articles."""
     
     def __init__(self, verbose: bool = False, model: str = None, temperature: float = None):
         """Initialize the news agent with the news fetching tool."""
-        # Store category for later use in _process_output
-        self._requested_category = "unknown" 
+        # Recent summaries keyed by the request fields that shape them
+        self._cache = TTLCache(maxsize=256, ttl=NEWS_CACHE_TTL)
+        # Runs currently in progress, keyed like the cache, so identical concurrent requests share one
+        self._in_flight: Dict[tuple, asyncio.Task] = {}
         
         super().__init__(
             name="NewsAgent",
@@ -170,8 +189,31 @@ class NewsAgent(BaseAgent[NewsRequest, NewsSummary]):
         Returns:
             A summary of the news articles
         """
+        # Identical requests within the TTL reuse the earlier summary, skipping both the
+        # news fetch and the LLM call. Voice and audio settings don't affect the summary.
+        cache_key = self._cache_key(input_data)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached news summary for category: {input_data.category}")
+            return cached
+        
+        # An identical request that arrives while one is already running waits for that run
+        # instead of starting a second news fetch and LLM call
+        task = self._in_flight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._run_and_cache(input_data, cache_key, parent_trace))
+            self._in_flight[cache_key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(cache_key, None))
+        else:
+            logger.info(f"Joining in-flight news request for category: {input_data.category}")
+        
+        # Shielded so a caller that is cancelled (e.g. on timeout) doesn't cancel the run for the others
+        return await asyncio.shield(task)
+    
+    async def _run_and_cache(self, input_data: NewsRequest, cache_key: tuple, parent_trace: Optional[Trace]) -> NewsSummary:
+        """Run the agent for a request and cache the summary if it succeeded."""
         # Store the requested category for use in _process_output
-        self._requested_category = input_data.category
+        _requested_category.set(input_data.category)
         
         # Run the base agent implementation
         # No need for TTS logic here, Coordinator handles it
@@ -179,8 +221,107 @@ class NewsAgent(BaseAgent[NewsRequest, NewsSummary]):
         
         # The result from super().run calls _process_output internally, 
         # which now handles JSON parsing and returns a NewsSummary object.
+        # Error summaries carry no articles and are not cached.
+        if result.articles:
+            self._cache.set(cache_key, result)
         return result
     
+    async def run_batch_async(self, inputs: List[NewsRequest], max_concurrency: int = 8, parent_trace: Optional[Trace] = None, dedupe: bool = False) -> List[NewsSummary]:
+        """
+        Run several news requests concurrently.
+        
+        Args:
+            inputs: The requests to run
+            max_concurrency: Maximum number of requests in flight at once
+            parent_trace: The parent trace for the agent's output
+            dedupe: Whether to drop articles already returned for an earlier request in the batch
+            
+        Returns:
+            One summary per request, in input order. A request that raises yields an error summary
+            instead of cancelling the rest of the batch.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run_one(request: NewsRequest) -> NewsSummary:
+            async with semaphore:
+                return await self.run(request, parent_trace=parent_trace)
+        
+        results = await asyncio.gather(*(run_one(request) for request in inputs), return_exceptions=True)
+        summaries = []
+        for request, result in zip(inputs, results):
+            if isinstance(result, BaseException):
+                logger.error(f"NewsAgent batch request for category {request.category} failed: {result}")
+                result = NewsSummary(
+                    category=request.category,
+                    article_count=0,
+                    articles=[],
+                    summary=f"Error: {result}",
+                    markdown=f"## Error\n\n{result}"
+                )
+            summaries.append(result)
+        if dedupe:
+            summaries = self._dedupe_articles(summaries)
+        return summaries
+    
+    def run_batch(self, inputs: List[NewsRequest], max_concurrency: int = 8, dedupe: bool = False) -> List[NewsSummary]:
+        """
+        Run several news requests concurrently from synchronous code.
+        
+        Args:
+            inputs: The requests to run
+            max_concurrency: Maximum number of requests in flight at once
+            dedupe: Whether to drop articles already returned for an earlier request in the batch
+            
+        Returns:
+            One summary per request, in input order
+        """
+        return asyncio.run(self.run_batch_async(inputs, max_concurrency=max_concurrency, dedupe=dedupe))
+    
+    @staticmethod
+    def _dedupe_articles(summaries: List[NewsSummary]) -> List[NewsSummary]:
+        """
+        Drop articles that already appeared in an earlier summary of the batch.
+        
+        Articles are matched by URL, or by title and source when they have no URL. Summaries
+        that lose articles are copied, since cached summaries are shared. Only the article list
+        and count change: summary and markdown are not regenerated and still describe every
+        article of the original run. A summary whose articles were all seen earlier is returned
+        unchanged rather than emptied, since an empty article list marks an error summary.
+        
+        Args:
+            summaries: The batch summaries, in input order
+            
+        Returns:
+            The summaries with repeated articles removed
+        """
+        seen = set()
+        deduped = []
+        for summary in summaries:
+            kept = []
+            for article in summary.articles:
+                key = article.url or (article.title, article.source)
+                if key in seen:
+                    continue
+                seen.add(key)
+                kept.append(article)
+            if kept and len(kept) != len(summary.articles):
+                summary = summary.model_copy(update={"articles": kept, "article_count": len(kept)})
+            deduped.append(summary)
+        return deduped
+    
+    @staticmethod
+    def _cache_key(input_data: NewsRequest) -> tuple:
+        """Build the summary cache key from the request fields that affect the summary."""
+        return (
+            input_data.category,
+            input_data.count,
+            input_data.country,
+            input_data.sources,
+            input_data.query,
+            input_data.page,
+            input_data.summary_style
+        )
+    
     def _process_output(self, output: str) -> NewsSummary:
         """
         Process the raw output from the agent (expected to be JSON) into a NewsSummary object.
@@ -195,8 +336,17 @@ class NewsAgent(BaseAgent[NewsRequest, NewsSummary]):
             # Clean the output string: remove potential markdown code fences
             cleaned_output = output.strip().strip("`json\n").strip("```")
             
+            # The reply must be a single JSON object, so anything that does not open with "{"
+            # (refusals, "no results" messages, markdown) skips the parse attempt and its exception handling
+            if cleaned_output.lstrip()[:1] != "{":
+                logger.error(f"NewsAgent output contains no JSON object\nRaw output:\n{output}")
+                return self._error_summary(
+                    "Error: Could not parse news summary data.",
+                    "## Error\n\nCould not parse news summary data from the agent."
+                )
+            
             # Attempt to parse the cleaned string as JSON
-            data = json.loads(cleaned_output)
+            data = json_utils.loads(cleaned_output)
             
             # Validate and create the Pydantic model
             # Ensure required fields exist
@@ -204,11 +354,11 @@ class NewsAgent(BaseAgent[NewsRequest, NewsSummary]):
                 raise ValueError("Missing required fields 'articles' or 'summary' in JSON output")
                 
             # Manually add derived/contextual fields before validation
-            data["category"] = self._requested_category # Use stored category
+            data["category"] = _requested_category.get() # Use stored category
             data["article_count"] = len(data.get("articles", []))
             
-            # Create the NewsSummary object
-            news_summary = NewsSummary(**data)
+            # Validate the whole dict in one call; pydantic-core builds the nested NewsArticles
+            news_summary = NewsSummary.model_validate(data)
             
             logger.info(f"Successfully parsed NewsAgent output for category: {news_summary.category}")
             return news_summary
@@ -216,30 +366,31 @@ class NewsAgent(BaseAgent[NewsRequest, NewsSummary]):
         except json.JSONDecodeError as e:
             logger.error(f"Failed to decode JSON from NewsAgent output: {e}\nRaw output:\n{output}")
             # Return a default/empty NewsSummary on failure
-            return NewsSummary(
-                category=self._requested_category,
-                article_count=0,
-                articles=[],
-                summary="Error: Could not parse news summary data.",
-                markdown="## Error\n\nCould not parse news summary data from the agent."
+            return self._error_summary(
+                "Error: Could not parse news summary data.",
+                "## Error\n\nCould not parse news summary data from the agent."
             )
         except (ValueError, TypeError, KeyError) as e:
             logger.error(f"Error validating/processing parsed JSON data: {e}\nParsed data:\n{data if 'data' in locals() else 'N/A'}\nRaw output:\n{output}")
              # Return a default/empty NewsSummary on failure
-            return NewsSummary(
-                category=self._requested_category,
-                article_count=0,
-                articles=[],
-                summary=f"Error: Invalid data structure received: {e}",
-                markdown=f"## Error\n\nInvalid data structure received from the agent: {e}"
+            return self._error_summary(
+                f"Error: Invalid data structure received: {e}",
+                f"## Error\n\nInvalid data structure received from the agent: {e}"
             )
         except Exception as e:
             logger.error(f"Unexpected error processing NewsAgent output: {e}\nRaw output:\n{output}")
              # Return a default/empty NewsSummary on failure
-            return NewsSummary(
-                category=self._requested_category,
-                article_count=0,
-                articles=[],
-                summary=f"Error: Unexpected error processing news data: {e}",
-                markdown=f"## Error\n\nUnexpected error processing news data: {e}"
-            ) 
+            return self._error_summary(
+                f"Error: Unexpected error processing news data: {e}",
+                f"## Error\n\nUnexpected error processing news data: {e}"
+            )
+
+    def _error_summary(self, summary: str, markdown: str) -> NewsSummary:
+        """Build an empty NewsSummary carrying an error message."""
+        return NewsSummary(
+            category=_requested_category.get(),
+            article_count=0,
+            articles=[],
+            summary=summary,
+            markdown=markdown
+        )
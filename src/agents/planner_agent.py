@@ -2,13 +2,22 @@
 
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field
+import json
+import re
 
 from src.agents.base_agent import BaseAgent
 from src.utils.tracing import tracing
 from src.config import get_logger
+from src.utils import json_utils
 
 logger = get_logger(__name__)
 
+# Patterns for pulling a plan out of the agent output: the outermost {...} span, then the
+# "Step N: action ..." text fallback and its "name: value" parameters
+_JSON_OBJECT_RE = re.compile(r'({[\s\S]*})')
+_STEP_RE = re.compile(r"Step (\d+):?\s*([a-zA-Z]+)(.*?)(?=Step \d+:|$)", re.DOTALL)
+_PARAM_RE = re.compile(r"(\w+):\s*([^,\n]+)")
+
 class PlannerInput(BaseModel):
     """Input model for the planner agent."""
     
@@ -133,30 +142,24 @@ class PlannerAgent(BaseAgent[PlannerInput, PlannerOutput]):
             )
         
         # Try to extract JSON if output contains JSON within other text
-        import json
-        import re
-        
         # Look for JSON-like patterns
-        json_pattern = r'({[\s\S]*})'
-        json_match = re.search(json_pattern, output)
+        json_match = _JSON_OBJECT_RE.search(output)
         
         if json_match:
             try:
                 # Try to parse the extracted JSON
                 potential_json = json_match.group(1)
-                data = json.loads(potential_json)
+                data = json_utils.loads(potential_json)
                 
                 # Extract the steps
-                steps_data = data.get("steps", [])
-                steps = []
-                
-                for step_data in steps_data:
-                    step = PlanStep(
+                steps = [
+                    PlanStep(
                         step=step_data.get("step", 0),
                         action=step_data.get("action", ""),
                         params=step_data.get("params", {})
                     )
-                    steps.append(step)
+                    for step_data in data.get("steps", [])
+                ]
                 
                 # Create the plan
                 plan = ProcessingPlan(
@@ -174,134 +177,91 @@ class PlannerAgent(BaseAgent[PlannerInput, PlannerOutput]):
                     plan=plan,
                     trace_id=trace_id
                 )
-            except json.JSONDecodeError:
-                pass  # Continue to next method if JSON extraction fails
+            except (json.JSONDecodeError, KeyError, AttributeError) as e:
+                # Handle parsing errors
+                logger.error(f"Error processing agent output: {str(e)}")
+        else:
+            # Without a {...} span the output cannot be a JSON plan, so go straight to the text fallback
+            logger.error("No JSON object found in agent output")
         
-        try:
-            # Try to parse the whole output as JSON
-            data = json.loads(output)
-            
-            # Extract the steps
-            steps_data = data.get("steps", [])
-            steps = []
-            
-            for step_data in steps_data:
+        # Try to extract basic steps using regex
+        steps = []
+        matches = _STEP_RE.finditer(output)
+        for i, match in enumerate(matches):
+            try:
+                step_num = int(match.group(1))
+                action = match.group(2).strip().lower()
+                details = match.group(3).strip()
+                
+                # Try to extract parameters
+                params = {}
+                param_matches = _PARAM_RE.finditer(details)
+                
+                for param_match in param_matches:
+                    param_name = param_match.group(1).strip().lower()
+                    param_value = param_match.group(2).strip()
+                    
+                    # Try to convert numeric values
+                    try:
+                        if param_value.isdigit():
+                            param_value = int(param_value)
+                        elif param_value.replace('.', '', 1).isdigit():
+                            param_value = float(param_value)
+                    except:
+                        pass
+                        
+                    params[param_name] = param_value
+                
                 step = PlanStep(
-                    step=step_data.get("step", 0),
-                    action=step_data.get("action", ""),
-                    params=step_data.get("params", {})
+                    step=step_num,
+                    action=action,
+                    params=params
                 )
                 steps.append(step)
-            
-            # Create the plan
+            except Exception as e:
+                logger.warning(f"Error parsing step {i+1}: {str(e)}")
+        
+        if steps:
             plan = ProcessingPlan(
                 steps=steps,
-                estimated_time=data.get("estimated_time", 60)
+                estimated_time=60  # Default value
             )
             
-            # Get the trace ID from the tracing manager
-            traces = tracing.get_traces()
-            trace_id = traces[0].get("trace_id") if traces else None
-            
-            # Return the result
             return PlannerOutput(
                 success=True,
                 plan=plan,
-                trace_id=trace_id
+                trace_id=None
             )
         
-        except (json.JSONDecodeError, KeyError, AttributeError) as e:
-            # Handle parsing errors
-            logger.error(f"Error processing agent output: {str(e)}")
-            
-            # Try to extract basic steps using regex
-            steps = []
-            step_pattern = r"Step (\d+):?\s*([a-zA-Z]+)(.*?)(?=Step \d+:|$)"
-            
-            matches = re.finditer(step_pattern, output, re.DOTALL)
-            for i, match in enumerate(matches):
-                try:
-                    step_num = int(match.group(1))
-                    action = match.group(2).strip().lower()
-                    details = match.group(3).strip()
-                    
-                    # Try to extract parameters
-                    params = {}
-                    param_pattern = r"(\w+):\s*([^,\n]+)"
-                    param_matches = re.finditer(param_pattern, details)
-                    
-                    for param_match in param_matches:
-                        param_name = param_match.group(1).strip().lower()
-                        param_value = param_match.group(2).strip()
-                        
-                        # Try to convert numeric values
-                        try:
-                            if param_value.isdigit():
-                                param_value = int(param_value)
-                            elif param_value.replace('.', '', 1).isdigit():
-                                param_value = float(param_value)
-                        except:
-                            pass
-                            
-                        params[param_name] = param_value
-                    
-                    step = PlanStep(
-                        step=step_num,
-                        action=action,
-                        params=params
-                    )
-                    steps.append(step)
-                except Exception as e:
-                    logger.warning(f"Error parsing step {i+1}: {str(e)}")
-            
-            if steps:
-                plan = ProcessingPlan(
-                    steps=steps,
-                    estimated_time=60  # Default value
-                )
-                
-                return PlannerOutput(
-                    success=True,
-                    plan=plan,
-                    trace_id=None
-                )
-            
-            # If no steps could be parsed, create a basic default plan
-            if not steps:
-                logger.warning("Generating default plan as fallback")
-                
-                # Create a minimal default plan based on input context
-                default_steps = [
-                    PlanStep(
-                        step=1,
-                        action="fetch_news",
-                        params={"category": "top-headlines", "count": 5}
-                    ),
-                    PlanStep(
-                        step=2,
-                        action="analyze",
-                        params={"depth": "moderate"}
-                    ),
-                    PlanStep(
-                        step=3,
-                        action="summarize",
-                        params={"format": "audio", "voice": "alloy"}
-                    )
-                ]
-                
-                plan = ProcessingPlan(
-                    steps=default_steps,
-                    estimated_time=120
-                )
-                
-                return PlannerOutput(
-                    success=True,
-                    plan=plan,
-                    trace_id=None
-                )
-            
-            return PlannerOutput(
-                success=False,
-                error=f"Failed to parse output: {str(e)}",
-                trace_id=None
-            ) 
+        # If no steps could be parsed, create a basic default plan
+        logger.warning("Generating default plan as fallback")
+        
+        # Create a minimal default plan based on input context
+        default_steps = [
+            PlanStep(
+                step=1,
+                action="fetch_news",
+                params={"category": "top-headlines", "count": 5}
+            ),
+            PlanStep(
+                step=2,
+                action="analyze",
+                params={"depth": "moderate"}
+            ),
+            PlanStep(
+                step=3,
+                action="summarize",
+                params={"format": "audio", "voice": "alloy"}
+            )
+        ]
+        
+        plan = ProcessingPlan(
+            steps=default_steps,
+            estimated_time=120
+        )
+        
+        return PlannerOutput(
+            success=True,
+            plan=plan,
+            trace_id=None
+        ) 
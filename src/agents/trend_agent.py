@@ -3,14 +3,24 @@
 from typing import List, Dict, Optional, Any
 from pydantic import BaseModel, Field
 import logging
-import json
+import re
 
 from agents import function_tool, WebSearchTool
-from src.agents.base_agent import BaseAgent
+from src.agents.base_agent import BaseAgent, Trace
 from src.config import get_logger
+from src.utils import json_utils
 
 logger = get_logger(__name__)
 
+# Fallback values for trend fields missing from the agent's JSON output
+_TREND_DEFAULTS = (
+    ("name", ""),
+    ("description", ""),
+    ("strength", "Emerging"),
+    ("supporting_articles", []),
+    ("timeframe", "Short-term"),
+)
+
 class TrendInput(BaseModel):
     """Input for the trend agent."""
     
@@ -90,27 +100,18 @@ Format your final output as a JSON object with keys 'trends' (a list of trend ob
     
     def _process_output(self, output: str) -> TrendOutput:
         """Process the agent output into the proper format."""
-        import re
-        
         try:
             # Try to parse as JSON first
-            data = json.loads(output)
-            trends = []
-            
-            for t in data.get("trends", []):
-                trends.append(Trend(
-                    name=t.get("name", ""),
-                    description=t.get("description", ""),
-                    strength=t.get("strength", "Emerging"),
-                    supporting_articles=t.get("supporting_articles", []),
-                    timeframe=t.get("timeframe", "Short-term")
-                ))
-            
-            return TrendOutput(
-                trends=trends,
-                meta_trends=data.get("meta_trends", []),
-                summary=data.get("summary", "")
-            )
+            data = json_utils.loads(output)
+            # Validate the whole output in one call; pydantic builds the nested trends
+            return TrendOutput.model_validate({
+                "trends": [
+                    {key: t.get(key, default) for key, default in _TREND_DEFAULTS}
+                    for t in data.get("trends", [])
+                ],
+                "meta_trends": data.get("meta_trends", []),
+                "summary": data.get("summary", "")
+            })
         except:
             # If not JSON, try to extract information from text
             trends = []
@@ -172,12 +173,13 @@ Format your final output as a JSON object with keys 'trends' (a list of trend ob
                 summary=summary
             )
 
-    async def run(self, input_data: TrendInput) -> TrendOutput:
+    async def run(self, input_data: TrendInput, parent_trace: Optional[Trace] = None) -> TrendOutput:
         """
         Run the trend agent to identify patterns and trends.
         
         Args:
             input_data: The input parameters
+            parent_trace: Optional parent Trace object for nesting.
             
         Returns:
             Identified trends and analysis
@@ -197,11 +199,10 @@ Format your final output as a JSON object with keys 'trends' (a list of trend ob
         if len(input_data.articles) < 3:
             self.logger.warning(f"Received only {len(input_data.articles)} articles - limited trend analysis possible")
         
-        # Log article titles to help with debugging
-        for i, article in enumerate(input_data.articles):
-            title = article.get("title", "No title")
-            source = article.get("source", "Unknown")
-            self.logger.info(f"Article {i+1}: {title[:50]}... (source: {source})")
+        # Log article titles to help with debugging (formatted lazily, and skipped when INFO is off)
+        if self.logger.isEnabledFor(logging.INFO):
+            for i, article in enumerate(input_data.articles, 1):
+                self.logger.info("Article %d: %.50s... (source: %s)", i, article.get("title", "No title"), article.get("source", "Unknown"))
         
         # Continue with regular processing
-        return await super().run(input_data) 
+        return await super().run(input_data, parent_trace=parent_trace) 
@@ -105,8 +105,9 @@ class WriterAgent(BaseAgent[WriterInput, WriterOutput]):
         """Process the agent output into the proper format."""
         processed_summary = output.strip()
         
+        # The writer only produces plain text, so markdown_output is left unset rather than
+        # storing (and serializing into traces) a second copy of the summary
         return WriterOutput(
             final_summary=processed_summary, 
-            markdown_output=processed_summary,
             audio_file=None
         ) 
@@ -1,13 +1,22 @@
 """News API tools for fetching and processing news articles."""
 
 import os
+import threading
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field
 import requests
 from src.config import get_logger
+from src.utils.cache import TTLCache
 
 logger = get_logger(__name__)
 
+# How long (seconds) fetched articles are reused for identical request parameters
+NEWS_FETCH_CACHE_TTL = 300
+
+# (connect, read) timeout in seconds for News API requests. run executes in worker threads that
+# cannot be cancelled, so a hung request must not block its thread indefinitely.
+NEWS_API_TIMEOUT = (5, 20)
+
 class FetchNewsInput(BaseModel):
     """Input schema for fetching news articles."""
     
@@ -40,13 +49,34 @@ class FetchNewsTool:
         self.api_key = os.getenv("NEWS_API_KEY")
         if not self.api_key:
             logger.warning("NEWS_API_KEY not found in environment variables")
+        
+        # Keep-alive sessions, so the TCP/TLS connection to the News API is reused instead of
+        # re-established per fetch (requests already asks for gzip). requests.Session is not
+        # documented as thread-safe and run is called from worker threads, so each thread gets its own.
+        self._local = threading.local()
+        
+        # Recent fetch results keyed by request parameters. run is called from worker threads,
+        # so cache access is guarded by a lock.
+        self._cache = TTLCache(maxsize=64, ttl=NEWS_FETCH_CACHE_TTL)
+        self._cache_lock = threading.Lock()
     
-    def run(self, input_data: FetchNewsInput) -> List[Dict[str, Any]]:
+    def _get_session(self) -> requests.Session:
+        """Get the calling thread's News API session, creating it on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            if self.api_key:
+                session.headers["X-Api-Key"] = self.api_key
+            self._local.session = session
+        return session
+    
+    def run(self, input_data: FetchNewsInput, no_cache: bool = False) -> List[Dict[str, Any]]:
         """
         Fetch news articles from the specified category.
         
         Args:
             input_data: The input parameters for the news fetch
+            no_cache: Whether to skip recently cached results and always call the API
             
         Returns:
             A list of news articles
@@ -60,11 +90,19 @@ class FetchNewsTool:
         # Validate and adjust count
         count = max(1, min(input_data.count, 10))
         
+        # Headlines change over minutes, so identical requests within the TTL reuse the last result
+        cache_key = (input_data.category, count, input_data.country, input_data.sources, input_data.query, input_data.page)
+        if not no_cache:
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Using cached articles for category: {input_data.category}")
+                return list(cached)
+        
         try:
             # Construct the API request
             url = "https://newsapi.org/v2/top-headlines"
             params = {
-                "apiKey": self.api_key,
                 "pageSize": count,
                 "language": "en"
             }
@@ -113,7 +151,7 @@ class FetchNewsTool:
             logger.info(f"API Request: {url} with params: {params}")
             
             # Make the API request
-            response = requests.get(url, params=params)
+            response = self._get_session().get(url, params=params, timeout=NEWS_API_TIMEOUT)
             response.raise_for_status()
             data = response.json()
             
@@ -123,18 +161,23 @@ class FetchNewsTool:
             logger.info(f"Successfully fetched {len(articles)} articles (total available: {total_results})")
             
             # Format articles for agent consumption
-            processed_articles = []
-            for article in articles:
-                processed_articles.append({
+            processed_articles = [
+                {
                     "title": article.get("title", "No title"),
                     "description": article.get("description", "No description"),
                     "url": article.get("url", ""),
                     "source": article.get("source", {}).get("name", "Unknown source"),
                     "published_at": article.get("publishedAt", ""),
                     "content": article.get("content", "No content")
-                })
-                
-            return processed_articles
+                }
+                for article in articles
+            ]
+            
+            # Empty results are not cached, so a transient gap in the feed is retried next call
+            if processed_articles:
+                with self._cache_lock:
+                    self._cache.set(cache_key, processed_articles)
+            return list(processed_articles)
             
         except Exception as e:
             logger.error(f"Error fetching news: {str(e)}")
@@ -0,0 +1,61 @@
+"""In-process caches for reusing agent and tool results."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+class TTLCache:
+    """A size-bounded LRU mapping whose entries expire a fixed time after they are stored."""
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept; the least recently used entry is evicted first
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: The cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            The cached value, or default
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entries beyond maxsize.
+
+        Args:
+            key: The cache key
+            value: The value to cache
+        """
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
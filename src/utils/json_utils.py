@@ -0,0 +1,26 @@
+"""JSON helpers for parsing agent output."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+    catching json.JSONDecodeError with either parser.
+
+    Args:
+        data: The JSON text to parse
+
+    Returns:
+        The parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,7 +1,11 @@
 """Text-to-speech utilities for converting text to audio files."""
 
 import os
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List
 from pathlib import Path
 from datetime import datetime
 import requests
@@ -10,6 +14,46 @@ from src.config import get_logger
 
 logger = get_logger(__name__)
 
+# The speech endpoint accepts at most this many characters per request. Only texts over the
+# limit are split (on sentence boundaries), synthesized concurrently and joined in order; anything
+# shorter is sent as one request so the audio has no joins.
+TTS_MAX_INPUT_CHARS = 4096
+TTS_MAX_WORKERS = 4
+
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+def _split_for_tts(text: str, max_chars: int = TTS_MAX_INPUT_CHARS) -> List[str]:
+    """Group sentences into chunks of at most max_chars, splitting any longer sentence at word boundaries."""
+    chunks = []
+    current = ""
+    for sentence in _SENTENCE_END_RE.split(text.strip()):
+        # A sentence over the limit joins the pending text and is cut at the last space that fits
+        # (or hard-cut if there is none)
+        if len(sentence) > max_chars and current:
+            sentence = f"{current} {sentence}"
+            current = ""
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars + 1)
+            if cut <= 0:
+                cut = max_chars
+            chunks.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip()
+        if not sentence:
+            continue
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+@lru_cache(maxsize=1)
+def _get_client(api_key: str) -> OpenAI:
+    """Get the shared OpenAI client for api_key, so its HTTP connection pool is reused across calls."""
+    return OpenAI(api_key=api_key)
+
 def text_to_speech(text: str, voice: str = "alloy", output_dir: str = None, filename: str = None) -> str:
     """
     Convert text to speech using OpenAI's TTS API and save to an audio file.
@@ -23,13 +67,14 @@ def text_to_speech(text: str, voice: str = "alloy", output_dir: str = None, file
     Returns:
         The path to the saved audio file
     """
-    # Initialize the OpenAI client
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    
-    if not client.api_key:
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
         logger.error("Cannot generate audio: OPENAI_API_KEY not found")
         return None
     
+    # Reuse the OpenAI client (and its open connections) from earlier calls
+    client = _get_client(api_key)
+    
     # Set up the output directory
     if not output_dir:
         today = datetime.now().strftime("%Y-%m-%d")
@@ -51,14 +96,28 @@ def text_to_speech(text: str, voice: str = "alloy", output_dir: str = None, file
         # Generate the speech
         logger.info(f"Generating speech with voice: {voice}")
         
-        response = client.audio.speech.create(
-            model="tts-1",
-            voice=voice,
-            input=text
-        )
-        
-        # Save the audio file
-        response.stream_to_file(output_path)
+        if len(text) <= TTS_MAX_INPUT_CHARS:
+            response = client.audio.speech.create(
+                model="tts-1",
+                voice=voice,
+                input=text
+            )
+            
+            # Save the audio file
+            response.stream_to_file(output_path)
+        else:
+            # Over the per-request limit: synthesize the chunks concurrently, then write them out in order
+            chunks = _split_for_tts(text)
+            logger.info(f"Synthesizing {len(chunks)} chunks in parallel")
+            def synthesize(chunk: str) -> bytes:
+                return client.audio.speech.create(model="tts-1", voice=voice, input=chunk).content
+            with ThreadPoolExecutor(max_workers=min(len(chunks), TTS_MAX_WORKERS)) as pool:
+                audio_parts = list(pool.map(synthesize, chunks))
+            
+            # Save the audio file
+            with open(output_path, "wb") as audio_file:
+                for part in audio_parts:
+                    audio_file.write(part)
         
         logger.info(f"Audio saved to: {output_path}")
         return output_path